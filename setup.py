@@ -78,6 +78,9 @@ setup(
             "ruff>=0.1.6",
             "pytest>=7.4.2",
         ],
+        "brotli": [
+            "brotli",
+        ],
     },
     license="HelpingAI",
     project_urls={
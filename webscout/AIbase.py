@@ -12,6 +12,8 @@ class AIProviderError(Exception):
     pass
 
 class Provider(ABC):
+    # Empty so subclasses that declare __slots__ don't get a __dict__ anyway
+    __slots__ = ()
 
     @abstractmethod
     def ask(
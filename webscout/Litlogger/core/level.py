@@ -1,6 +1,6 @@
-from enum import Enum
+from enum import IntEnum
 
-class LogLevel(Enum):
+class LogLevel(IntEnum):
     NOTSET = 0
     DEBUG = 10
     INFO = 20
@@ -8,16 +8,21 @@ class LogLevel(Enum):
     ERROR = 40
     CRITICAL = 50
 
+    # Keep the Enum-style "LogLevel.INFO" text; IntEnum would render the number on 3.11+
+    def __str__(self) -> str:
+        return f"{type(self).__name__}.{self.name}"
+
+    def __format__(self, format_spec: str) -> str:
+        return format(str(self), format_spec)
+
     @staticmethod
     def get_level(level_str: str) -> 'LogLevel':
         if not level_str:
             return LogLevel.NOTSET
         try:
-            return LogLevel[level_str.upper()]
+            return _LEVEL_MAP[level_str if level_str.islower() else level_str.lower()]
         except KeyError:
             raise ValueError(f"Invalid log level: {level_str}")
 
-    def __lt__(self, other):
-        if isinstance(other, LogLevel):
-            return self.value < other.value
-        return NotImplemented
+# Lower-cased name lookup for get_level, avoids going through the Enum metaclass
+_LEVEL_MAP = {level.name.lower(): level for level in LogLevel}
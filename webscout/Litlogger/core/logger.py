@@ -124,7 +124,7 @@ class Logger:
         if self._should_log(level):
             formatted_message = self._format_message(level, message, **kwargs)
             for handler in self.handlers:
-                if handler.level == LogLevel.NOTSET or level.value >= handler.level.value:
+                if handler.level == LogLevel.NOTSET or level >= handler.level:
                     handler.emit(formatted_message, level)
 
     async def _async_log(self, level: LogLevel, message: str, **kwargs):
@@ -132,7 +132,7 @@ class Logger:
             formatted_message = self._format_message(level, message, **kwargs)
             tasks = []
             for handler in self.handlers:
-                if handler.level == LogLevel.NOTSET or level.value >= handler.level.value:
+                if handler.level == LogLevel.NOTSET or level >= handler.level:
                     if hasattr(handler, 'async_emit'):
                         tasks.append(handler.async_emit(formatted_message, level))
                     else:
@@ -140,7 +140,7 @@ class Logger:
             await asyncio.gather(*tasks)
 
     def _should_log(self, level: LogLevel) -> bool:
-        return self.level == LogLevel.NOTSET or level.value >= self.level.value
+        return self.level == LogLevel.NOTSET or level >= self.level
 
     def set_context(self, **kwargs):
         self._context_data.update(kwargs)
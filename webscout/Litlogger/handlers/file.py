@@ -117,7 +117,7 @@ class FileHandler:
         
     def emit(self, message: str, level: LogLevel):
         """Write log message to file if level is sufficient."""
-        if level.value >= self.level.value:
+        if level >= self.level:
             try:
                 if self._should_rollover():
                     self._do_rollover()
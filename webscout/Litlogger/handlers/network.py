@@ -119,14 +119,14 @@ class NetworkHandler:
         Synchronously send log message.
         Not recommended - use async_emit instead.
         """
-        if level.value >= self.level.value:
+        if level >= self.level:
             loop = asyncio.get_event_loop()
             loop.run_until_complete(self.async_emit(message, level))
             
     async def async_emit(self, message: str, level: LogLevel):
         """Asynchronously send log message to remote server."""
         # Fix: Allow all messages if level is NOTSET
-        if self.level == LogLevel.NOTSET or level.value >= self.level.value:
+        if self.level == LogLevel.NOTSET or level >= self.level:
             log_data = {
                 "message": message,
                 "level": level.name,
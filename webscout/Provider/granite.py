@@ -1,11 +1,91 @@
 import requests
-import json
-from typing import Any, Dict, Generator
+import threading
+import time
+import types
+from http.cookiejar import DefaultCookiePolicy
+from typing import Any, Dict, Generator, Optional
 
 from webscout.AIutel import Optimizers, Conversation, AwesomePrompts
 from webscout.AIbase import Provider
 from webscout import exceptions
 from webscout import LitAgent as Lit
+from webscout.Litlogger import Logger, LogFormat
+
+try:
+    from orjson import loads
+except ImportError:
+    try:
+        from ujson import loads
+    except ImportError:
+        from json import loads
+
+_API_ENDPOINT = "https://d18n68ssusgr7r.cloudfront.net/v1/chat/completions"
+
+# Keep-alive connections to the Granite endpoint are shared by all instances
+# that don't need their own proxy configuration; built on first use. Nothing
+# per-instance (headers, proxies, cookies) may be stored on it, as every instance would see it
+_SESSION = None
+_SESSION_WARMED = False
+_SESSION_LOCK = threading.Lock()
+
+def _warm_session(session: requests.Session) -> None:
+    """Sends a bare HEAD request to the endpoint, leaving a keep-alive socket in the pool."""
+    try:
+        session.head(_API_ENDPOINT, timeout=5)
+    except requests.exceptions.RequestException:
+        pass
+
+def _shared_session(warmup: bool = False) -> requests.Session:
+    """Returns the module-wide pooled session, creating it on first call.
+
+    With `warmup`, the first such call opens a pooled connection in the background
+    so the first request skips DNS/TCP/TLS setup; later calls don't warm again.
+    """
+    global _SESSION, _SESSION_WARMED
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=16, pool_maxsize=64, max_retries=0)
+            session.mount("https://", adapter)
+            # An empty allow-list rejects every cookie, so one API key's cookies never reach another's requests
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            _SESSION = session
+        start_warmup = warmup and not _SESSION_WARMED
+        if start_warmup:
+            _SESSION_WARMED = True
+        session = _SESSION
+    if start_warmup:
+        threading.Thread(target=_warm_session, args=(session,), daemon=True).start()
+    return session
+
+class _NoOpLogger:
+    """Stands in for Logger when logging is disabled so call sites need no checks."""
+
+    def _noop(self, *args, **kwargs):
+        pass
+
+    debug = info = warning = error = critical = _noop
+
+_NOOP_LOGGER = _NoOpLogger()
+
+def _parse_frame(line: bytes) -> Optional[str]:
+    """Returns the text of a `[3,"<text>"]` stream frame, or None for any other line."""
+    # Text frames always look like [3,"<text>"]; skip everything else unparsed
+    if not line.startswith(b'[3,"'):
+        return None
+    body = line[4:-2]
+    # Bytes membership is a memchr scan, far cheaper than running the JSON
+    # decoder; only payloads with escapes or embedded quotes need loads
+    # Undecodable bytes become U+FFFD on both paths, as iter_lines(decode_unicode=True) did
+    if line.endswith(b'"]', 4) and b"\\" not in body and b'"' not in body:
+        return body.decode("utf-8", "replace")
+    try:
+        data = loads(line.decode("utf-8", "replace"))
+    except (ValueError, TypeError):
+        return None
+    if len(data) == 2 and data[0] == 3 and isinstance(data[1], str):
+        return data[1]
+    return None
 
 class IBMGranite(Provider):
     """
@@ -15,6 +95,41 @@ class IBMGranite(Provider):
 
     AVAILABLE_MODELS = ["granite-3-8b-instruct", "granite-3-2-8b-instruct"]
 
+    __slots__ = (
+        "logger",
+        "session",
+        "is_conversation",
+        "max_tokens_to_sample",
+        "api_endpoint",
+        "stream_chunk_size",
+        "timeout",
+        "last_response",
+        "model",
+        "system_prompt",
+        "thinking",
+        "headers",
+        "__available_optimizers",
+        "conversation",
+    )
+
+    # User-Agent pool shared by all instances, built on first use
+    _lit = None
+    _ua_pool = None
+    _ua_idx = 0
+    _ua_pool_size = 16
+    _ua_lock = threading.Lock()
+
+    @classmethod
+    def _next_user_agent(cls) -> str:
+        """Returns the next User-Agent from the shared rotating pool."""
+        with cls._ua_lock:
+            if cls._ua_pool is None:
+                cls._lit = Lit()
+                cls._ua_pool = [cls._lit.random() for _ in range(cls._ua_pool_size)]
+            ua = cls._ua_pool[cls._ua_idx % cls._ua_pool_size]
+            cls._ua_idx += 1
+        return ua
+
     def __init__(
         self,
         api_key: str,
@@ -30,16 +145,27 @@ class IBMGranite(Provider):
         model: str = "granite-3-2-8b-instruct",
         system_prompt: str = "You are a helpful AI assistant.",
         thinking: bool = False,
+        logging: bool = False,
+        warmup: bool = True,
     ):
         """Initializes the IBMGranite API client using Lit agent for the user agent."""
+        self.logger = Logger(
+            name="IBMGranite",
+            format=LogFormat.MODERN_EMOJI,
+        ) if logging else _NOOP_LOGGER
+
         if model not in self.AVAILABLE_MODELS:
             raise ValueError(f"Invalid model: {model}. Choose from: {self.AVAILABLE_MODELS}")
 
-        self.session = requests.Session()
+        if proxies:
+            self.session = requests.Session()
+            self.session.proxies = proxies
+        else:
+            self.session = _shared_session(warmup)
         self.is_conversation = is_conversation
         self.max_tokens_to_sample = max_tokens
-        self.api_endpoint = "https://d18n68ssusgr7r.cloudfront.net/v1/chat/completions"
-        self.stream_chunk_size = 64
+        self.api_endpoint = _API_ENDPOINT
+        self.stream_chunk_size = 16384
         self.timeout = timeout
         self.last_response = {}
         self.model = model
@@ -47,19 +173,19 @@ class IBMGranite(Provider):
         self.thinking = thinking
 
         # Use Lit agent to generate a random User-Agent
-        self.headers = {
+        headers = {
             "authority": "d18n68ssusgr7r.cloudfront.net",
             "accept": "application/json,application/jsonl",
             "content-type": "application/json",
             "origin": "https://www.ibm.com",
             "referer": "https://www.ibm.com/",
-            "user-agent": Lit().random(),
+            "user-agent": self._next_user_agent(),
         }
-        self.headers["Authorization"] = f"Bearer {api_key}"
-        self.session.headers.update(self.headers)
-        self.session.proxies = proxies
+        headers["Authorization"] = f"Bearer {api_key}"
+        # Read-only and sent with every request instead of living on the (possibly shared) session
+        self.headers = types.MappingProxyType(headers)
 
-        self.__available_optimizers = (
+        self.__available_optimizers = frozenset(
             method for method in dir(Optimizers)
             if callable(getattr(Optimizers, method)) and not method.startswith("__")
         )
@@ -73,6 +199,7 @@ class IBMGranite(Provider):
         )
         self.conversation = Conversation(is_conversation, self.max_tokens_to_sample, filepath, update_file)
         self.conversation.history_offset = history_offset
+        self.logger.info(f"Initialized IBMGranite with model: {self.model}")
 
     def ask(
         self,
@@ -81,6 +208,8 @@ class IBMGranite(Provider):
         raw: bool = False,
         optimizer: str = None,
         conversationally: bool = False,
+        coalesce_ms: int = 0,
+        coalesce_chars: int = 0,
     ) -> Dict[str, Any] | Generator[Dict[str, Any], None, None]:
         """Chat with AI
         Args:
@@ -89,16 +218,23 @@ class IBMGranite(Provider):
             raw (bool, optional): Stream back raw response as received. Defaults to False.
             optimizer (str, optional): Prompt optimizer name - `[code, shell_command]`. Defaults to None.
             conversationally (bool, optional): Chat conversationally when using optimizer. Defaults to False.
+            coalesce_ms (int, optional): Merge tokens after the first for this many ms, checked per token. Defaults to 0.
+            coalesce_chars (int, optional): Yield merged tokens once this many chars are pending. Defaults to 0.
         Returns:
             Union[Dict, Generator[Dict, None, None]]: Response generated
         """
+        # Skip building the message entirely when logging is disabled
+        if self.logger is not _NOOP_LOGGER:
+            self.logger.debug(f"Processing request [stream={stream}] Prompt: {prompt[:50]}")
         conversation_prompt = self.conversation.gen_complete_prompt(prompt)
         if optimizer:
             if optimizer in self.__available_optimizers:
                 conversation_prompt = getattr(Optimizers, optimizer)(
                     conversation_prompt if conversationally else prompt
                 )
+                self.logger.debug(f"Applied optimizer: {optimizer}")
             else:
+                self.logger.error(f"Invalid optimizer requested: {optimizer}")
                 raise Exception(f"Optimizer is not one of {self.__available_optimizers}")
 
         payload = {
@@ -118,49 +254,116 @@ class IBMGranite(Provider):
                 )
                 if not response.ok:
                     msg = f"Request failed with status code {response.status_code}: {response.text}"
+                    self.logger.error(msg)
                     raise exceptions.FailedToGenerateResponseError(msg)
 
-                streaming_text = ""
-                for line in response.iter_lines(decode_unicode=True):
-                    if line:
-                        try:
-                            data = json.loads(line)
-                            if len(data) == 2 and data[0] == 3 and isinstance(data[1], str):
-                                content = data[1]
-                                streaming_text += content
-                                yield content if raw else dict(text=content)
-                            else:
-                                # Skip unrecognized lines
-                                pass
-                        except json.JSONDecodeError:
-                            continue
-                self.last_response.update(dict(text=streaming_text))
+                parts = []
+                coalesce = coalesce_ms > 0 or coalesce_chars > 0
+                pending = []
+                pending_len = 0
+                first = True
+                last_flush = 0.0
+                for line in self._iter_lines(response):
+                    content = _parse_frame(line)
+                    if content is None:
+                        # Skip unrecognized lines
+                        continue
+                    parts.append(content)
+                    if not coalesce:
+                        yield content if raw else dict(text=content)
+                        continue
+                    if first:
+                        # Never hold back the first token
+                        first = False
+                        last_flush = time.monotonic()
+                        yield content if raw else dict(text=content)
+                        continue
+                    pending.append(content)
+                    pending_len += len(content)
+                    if (coalesce_chars > 0 and pending_len >= coalesce_chars) or (
+                        coalesce_ms > 0 and (time.monotonic() - last_flush) * 1000 >= coalesce_ms
+                    ):
+                        text = "".join(pending)
+                        pending.clear()
+                        pending_len = 0
+                        last_flush = time.monotonic()
+                        yield text if raw else dict(text=text)
+                if pending:
+                    text = "".join(pending)
+                    yield text if raw else dict(text=text)
+                self.last_response.update(dict(text="".join(parts)))
                 self.conversation.update_chat_history(prompt, self.get_message(self.last_response))
+                self.logger.debug("Streaming response completed")
             except requests.exceptions.RequestException as e:
-                raise exceptions.ProviderConnectionError(f"Request failed: {e}")
-            except json.JSONDecodeError as e:
-                raise exceptions.InvalidResponseError(f"Failed to decode JSON response: {e}")
+                raise exceptions.APIConnectionError(f"Request failed: {e}")
             except Exception as e:
                 raise exceptions.FailedToGenerateResponseError(f"An unexpected error occurred: {e}")
 
         def for_non_stream():
-            # Run the generator to completion
-            for _ in for_stream():
-                pass
-            return self.last_response
+            try:
+                response = self.session.post(
+                    self.api_endpoint, headers=self.headers, json=payload, timeout=self.timeout
+                )
+                if not response.ok:
+                    msg = f"Request failed with status code {response.status_code}: {response.text}"
+                    self.logger.error(msg)
+                    raise exceptions.FailedToGenerateResponseError(msg)
+
+                # One parse of the whole body instead of one per frame
+                try:
+                    text = loads(response.content)["choices"][0]["message"]["content"]
+                except (ValueError, TypeError, KeyError, IndexError):
+                    text = None
+                if not isinstance(text, str):
+                    # The server ignored stream=False and sent frames anyway
+                    frames = (_parse_frame(line) for line in response.content.splitlines())
+                    text = "".join(frame for frame in frames if frame is not None)
+                self.last_response.update(dict(text=text))
+                self.conversation.update_chat_history(prompt, self.get_message(self.last_response))
+                self.logger.debug("Response completed")
+                return self.last_response
+            except requests.exceptions.RequestException as e:
+                raise exceptions.APIConnectionError(f"Request failed: {e}")
+            except Exception as e:
+                raise exceptions.FailedToGenerateResponseError(f"An unexpected error occurred: {e}")
 
         return for_stream() if stream else for_non_stream()
 
+    def _iter_lines(self, response: requests.Response) -> Generator[bytes, None, None]:
+        """Yields non-empty raw lines from a streamed response, read in `stream_chunk_size` blocks."""
+        # Chunked responses hand over each chunk as it arrives, so a large read size costs no latency.
+        # Otherwise urllib3 waits for a full read, so keep requests' small iter_lines default
+        if getattr(response.raw, "chunked", False):
+            chunk_size = self.stream_chunk_size
+        else:
+            chunk_size = requests.models.ITER_CHUNK_SIZE
+        buf = bytearray()
+        for chunk in response.iter_content(chunk_size=chunk_size):
+            buf.extend(chunk)
+            while (idx := buf.find(b"\n")) != -1:
+                line = bytes(buf[:idx]).rstrip(b"\r")
+                del buf[:idx + 1]
+                if line:
+                    yield line
+        line = bytes(buf).rstrip(b"\r")
+        if line:
+            yield line
+
     def chat(
         self,
         prompt: str,
         stream: bool = False,
         optimizer: str = None,
         conversationally: bool = False,
+        coalesce_ms: int = 0,
+        coalesce_chars: int = 0,
     ) -> str | Generator[str, None, None]:
         """Generate response as a string using chat method"""
         def for_stream():
-            for response in self.ask(prompt, True, optimizer=optimizer, conversationally=conversationally):
+            for response in self.ask(
+                prompt, True, optimizer=optimizer, conversationally=conversationally,
+                coalesce_ms=coalesce_ms, coalesce_chars=coalesce_chars,
+            ):
                 yield self.get_message(response)
 
         def for_non_stream():